@@ -1,112 +1,230 @@
-import json
+import hashlib
+import hmac
 import os
-from flask import Flask, request, jsonify
+import ssl
+import sys
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from flask import Flask, g, has_app_context, jsonify, request
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry import default_retry_handlers
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 import logging
-from datetime import datetime
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
 
-# Initialize Slack client
-slack_client = WebClient(token=os.environ.get("SLACK_BOT_TOKEN"))
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
 
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
 
-# Load maintainers configuration
-def load_maintainers_config():
-    """Load maintainer configuration from JSON file"""
-    return {
-        "projects": {
-            "default": {
-                "project_name": "KubeStellar Core",
-                "docs_url": "https://docs.kubestellar.io",
-                "github_url": "https://github.com/kubestellar/kubestellar",
-                "description": "Multi-cluster configuration management for Kubernetes",
-                "maintainers": ["Andy"],
-            },
-            "kubestellar": {
-                "project_name": "KubeStellar Core",
-                "docs_url": "https://docs.kubestellar.io",
-                "github_url": "https://github.com/kubestellar/kubestellar",
-                "description": "Multi-cluster configuration management for Kubernetes",
-                "maintainers": ["Andy"],
-            },
-            "kubeflex": {
-                "project_name": "KubeFlex",
-                "docs_url": "https://github.com/kubestellar/kubeflex#readme",
-                "github_url": "https://github.com/kubestellar/kubeflex",
-                "description": "A flexible and scalable platform for running Kubernetes control plane APIs.",
-                "maintainers": ["Andy"],
-            },
-            "ui": {
-                "project_name": "KubeStellar UI",
-                "docs_url": "https://github.com/kubestellar/ui#readme",
-                "github_url": "https://github.com/kubestellar/ui",
-                "description": "Web-based user interface for KubeStellar",
-                "maintainers": ["Andy"],
-            },
-            "a2a": {
-                "project_name": "KubeStellar Agent2Agent/MCP Protocol",
-                "docs_url": "https://github.com/kubestellar/a2a#readme",
-                "github_url": "https://github.com/kubestellar/a2a",
-                "description": "KubeStellar's A2A and MCP server component",
-                "maintainers": ["Andy"],
-            },
-        },
-        "organization": {
-            "name": "KubeStellar",
-            "website": "https://kubestellar.io",
-            "docs": "https://docs.kubestellar.io",
-            "github": "https://github.com/kubestellar",
-        },
-    }
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str step
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
 
-def get_project_info(project_key="default"):
-    """Get project information for a specific project"""
-    config = load_maintainers_config()
-    return config.get("projects", {}).get(
-        project_key, config.get("projects", {}).get("default", {})
+
+app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Gzip the multi-KB Block Kit replies when the client accepts it
+app.config["COMPRESS_ALGORITHM"] = "gzip"
+app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+app.config["COMPRESS_MIN_SIZE"] = 500
+app.config["COMPRESS_LEVEL"] = 6
+Compress(app)
+
+# Check for required environment variables before serving any request
+SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
+if not SLACK_BOT_TOKEN:
+    logger.error("SLACK_BOT_TOKEN environment variable is required")
+    sys.exit(1)
+
+# Server settings, read once at import
+PORT = int(os.environ.get("PORT", 3000))
+DEBUG = os.environ.get("DEBUG", "False").lower() == "true"
+
+# Initialize Slack client. A shared SSL context saves urllib from loading
+# the CA bundle on every call; rate-limited calls are retried after the
+# Retry-After delay on top of the default connection error retries.
+slack_client = WebClient(
+    token=SLACK_BOT_TOKEN,
+    timeout=10,
+    ssl=ssl.create_default_context(),
+    retry_handlers=default_retry_handlers()
+    + [RateLimitErrorRetryHandler(max_retry_count=2)],
+)
+
+# Welcome DMs are sent off the request thread so events are acked promptly
+_EXEC = ThreadPoolExecutor(max_workers=8)
+
+# Signing secret used to verify requests, encoded once up front
+SLACK_SIGNING_SECRET = os.environ.get("SLACK_SIGNING_SECRET", "").encode()
+if not SLACK_SIGNING_SECRET:
+    logger.warning(
+        "SLACK_SIGNING_SECRET is not set, slash command signatures are not verified"
     )
 
 
-def format_maintainers(maintainers_list):
-    """Format maintainers list for display"""
-    if not maintainers_list:
-        return "No maintainers assigned"
+# Load maintainers configuration
+MAINTAINERS_CONFIG_PATH = Path(__file__).resolve().with_name("maintainers.json")
 
-    # Join maintainers with commas, don't add @ if already present
-    formatted = []
-    for maintainer in maintainers_list:
-        if maintainer.startswith("@"):
-            formatted.append(maintainer)
-        else:
-            formatted.append(f"@{maintainer}")
+# Parsed config, reused until maintainers.json changes on disk
+_CFG_CACHE = {"mtime": None, "data": None}
+_CFG_LOCK = threading.Lock()
 
-    return ", ".join(formatted)
 
+def load_maintainers_config():
+    """Load maintainer configuration from JSON file
 
-def create_project_blocks(username, project_info, command_type="contribute"):
-    """Create Slack Block Kit formatted message"""
-    project_name = project_info.get("project_name", "KubeStellar")
-    docs_url = project_info.get("docs_url", "https://docs.kubestellar.io")
-    github_url = project_info.get(
-        "github_url", "https://github.com/kubestellar/kubestellar"
+    The parsed file is cached in-process and only re-read when its
+    modification time changes. If the file is missing or invalid the last
+    good config (or an empty one) is returned instead.
+    """
+    try:
+        mtime = MAINTAINERS_CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        logger.error(f"Maintainers config not found: {MAINTAINERS_CONFIG_PATH}")
+        return _CFG_CACHE["data"] or {}
+
+    if mtime == _CFG_CACHE["mtime"]:
+        return _CFG_CACHE["data"]
+
+    with _CFG_LOCK:
+        # Another thread may have reloaded the file while we waited
+        if mtime == _CFG_CACHE["mtime"]:
+            return _CFG_CACHE["data"]
+
+        try:
+            data = orjson.loads(MAINTAINERS_CONFIG_PATH.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError) as e:
+            logger.error(f"Error loading maintainers config: {str(e)}")
+            # Keep serving the previous config until the file changes again
+            data = _CFG_CACHE["data"] or {}
+            _CFG_CACHE["data"] = data
+            _CFG_CACHE["mtime"] = mtime
+            return data
+
+        # Format maintainers once per load rather than on every render
+        for project in data.get("projects", {}).values():
+            project["maintainers_display"] = format_maintainers(
+                project.get("maintainers", [])
+            )
+
+        # Publish data before mtime so a matching mtime always sees it
+        _CFG_CACHE["data"] = data
+        _CFG_CACHE["mtime"] = mtime
+        return data
+
+
+def _get_cfg():
+    """Return the maintainers config, fetched at most once per request"""
+    if not has_app_context():
+        return load_maintainers_config()
+
+    cfg = getattr(g, "_cfg", None)
+    if cfg is None:
+        g._cfg = cfg = load_maintainers_config()
+    return cfg
+
+
+# Stand-in user id baked into cached payloads and swapped per request
+USER_ID_PLACEHOLDER = "__USER_ID__"
+_USER_ID_PLACEHOLDER_BYTES = USER_ID_PLACEHOLDER.encode()
+
+# Encoded blocks per builder, as (config, bytes) so a reload invalidates them
+_BLOCKS_CACHE = {}
+
+
+def render_blocks(builder, user_id):
+    """Return builder's blocks as encoded JSON personalised for user_id
+
+    The builder runs once per loaded config with USER_ID_PLACEHOLDER; later
+    calls only substitute the user id into the cached bytes.
+    """
+    config = _get_cfg()
+    cached = _BLOCKS_CACHE.get(builder)
+    if cached is None or cached[0] is not config:
+        cached = (config, orjson.dumps(builder(USER_ID_PLACEHOLDER)))
+        _BLOCKS_CACHE[builder] = cached
+
+    # Encode the id as a JSON string body so it can't break out of the payload
+    return cached[1].replace(
+        _USER_ID_PLACEHOLDER_BYTES, orjson.dumps(str(user_id))[1:-1]
     )
-    description = project_info.get(
-        "description",
-        "A flexible solution for multi-cluster configuration management for edge, multi-cloud, and hybrid cloud.",
+
+
+def blocks_response(blocks_json):
+    """Wrap encoded blocks in an in_channel slash command response"""
+    return app.response_class(
+        b'{"response_type":"in_channel","blocks":' + blocks_json + b"}",
+        mimetype="application/json",
     )
-    maintainers = format_maintainers(project_info.get("maintainers", ["Andy"]))
 
-    # Load organization info
-    config = load_maintainers_config()
-    org_info = config.get("organization", {})
-    org_name = org_info.get("name", "KubeStellar")
+
+def get_project_info(project_key="default", config=None):
+    """Get project information for a specific project"""
+    if config is None:
+        config = _get_cfg()
+    projects = config.get("projects") or {}
+    return projects.get(project_key) or projects.get("default") or {}
+
+
+def format_maintainers(maintainers_list):
+    """Format maintainers list for display"""
+    # Join maintainers with commas, don't add @ if already present
+    formatted = ", ".join(
+        [m if m[:1] == "@" else f"@{m}" for m in maintainers_list or ()]
+    )
+    return formatted or "No maintainers assigned"
+
+
+# Blocks shared by every message; the encoders never mutate them
+_DIVIDER = {"type": "divider"}
+_LOGO_ACCESSORY = {
+    "type": "image",
+    "image_url": "https://avatars.githubusercontent.com/u/134407106?s=200&v=4",
+    "alt_text": "KubeStellar logo",
+}
+
+# Fallbacks for fields missing from maintainers.json
+_ORG_DEFAULTS = {
+    "name": "KubeStellar",
+    "website": "https://kubestellar.io",
+    "docs": "https://docs.kubestellar.io",
+    "github": "https://github.com/kubestellar",
+    "join_us": "http://kubestellar.io/join_us",
+}
+_PROJECT_DEFAULTS = {
+    "project_name": "KubeStellar",
+    "docs_url": "https://docs.kubestellar.io",
+    "github_url": "https://github.com/kubestellar/kubestellar",
+    "description": "A flexible solution for multi-cluster configuration management for edge, multi-cloud, and hybrid cloud.",
+}
+
+
+def create_project_blocks(username, project_info, org_info, command_type="contribute"):
+    """Create Slack Block Kit formatted message"""
+    project_name = project_info.get("project_name") or _PROJECT_DEFAULTS["project_name"]
+    docs_url = project_info.get("docs_url") or _PROJECT_DEFAULTS["docs_url"]
+    github_url = project_info.get("github_url") or _PROJECT_DEFAULTS["github_url"]
+    description = project_info.get("description") or _PROJECT_DEFAULTS["description"]
+    org_name = org_info.get("name") or _ORG_DEFAULTS["name"]
+    website = org_info.get("website") or _ORG_DEFAULTS["website"]
 
     blocks = [
         {
@@ -120,15 +238,11 @@ def create_project_blocks(username, project_info, command_type="contribute"):
                 "text": f"Hi <@{username}>! 🤖 *I'm the KubeStellar bot* - here to help you get started with contributing to our open source projects!",
             },
         },
-        {"type": "divider"},
+        _DIVIDER,
         {
             "type": "section",
             "text": {"type": "mrkdwn", "text": f"🚀 *{project_name}*\n_{description}_"},
-            "accessory": {
-                "type": "image",
-                "image_url": "https://avatars.githubusercontent.com/u/134407106?s=200&v=4",
-                "alt_text": "KubeStellar logo",
-            },
+            "accessory": _LOGO_ACCESSORY,
         },
         {
             "type": "section",
@@ -151,15 +265,15 @@ def create_project_blocks(username, project_info, command_type="contribute"):
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                "text": f"*🌐 Main Website*\n<{org_info.get('website', 'https://kubestellar.io')}|Visit KubeStellar.io>",
+                "text": f"*🌐 Main Website*\n<{website}|Visit KubeStellar.io>",
             },
         },
-        {"type": "divider"},
+        _DIVIDER,
         {
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                "text": f"🤝 *Getting Help*\n*New to open source?* No worries! We're here to help you make your first contribution.\n\n*Have questions about this project?* Tag: Andy",
+                "text": "🤝 *Getting Help*\n*New to open source?* No worries! We're here to help you make your first contribution.\n\n*Have questions about this project?* Tag: Andy",
             },
         },
         {
@@ -199,7 +313,7 @@ def create_project_blocks(username, project_info, command_type="contribute"):
                 {
                     "type": "button",
                     "text": {"type": "plain_text", "text": "🌐 Website"},
-                    "url": org_info.get("website", "https://kubestellar.io"),
+                    "url": website,
                 },
             ],
         },
@@ -219,7 +333,7 @@ def create_project_blocks(username, project_info, command_type="contribute"):
 
 def create_help_blocks(user_id):
     """Create help message blocks"""
-    config = load_maintainers_config()
+    config = _get_cfg()
     projects = config.get("projects", {})
     org_info = config.get("organization", {})
 
@@ -235,7 +349,7 @@ def create_help_blocks(user_id):
                 "text": "Your guide to contributing to KubeStellar open source projects!",
             },
         },
-        {"type": "divider"},
+        _DIVIDER,
         {
             "type": "section",
             "text": {"type": "mrkdwn", "text": "🚀 *Project Commands*"},
@@ -269,7 +383,7 @@ def create_help_blocks(user_id):
                 {"type": "mrkdwn", "text": "`/help`\nThis help menu"},
             ],
         },
-        {"type": "divider"},
+        _DIVIDER,
         {
             "type": "section",
             "text": {
@@ -282,7 +396,7 @@ def create_help_blocks(user_id):
 
     # Add maintainers for each project
     for project_key, project_data in projects.items():
-        maintainers = format_maintainers(project_data.get("maintainers", []))
+        maintainers = project_data["maintainers_display"]
         project_name = project_data.get(
             "project_name", project_key.replace("_", " ").title()
         )
@@ -296,7 +410,7 @@ def create_help_blocks(user_id):
     # Add quick links section
     blocks.extend(
         [
-            {"type": "divider"},
+            _DIVIDER,
             {"type": "section", "text": {"type": "mrkdwn", "text": "🌟 *Quick Links*"}},
             {
                 "type": "actions",
@@ -305,22 +419,22 @@ def create_help_blocks(user_id):
                         "type": "button",
                         "text": {"type": "plain_text", "text": "🌐 Website"},
                         "style": "primary",
-                        "url": org_info.get("website", "https://kubestellar.io"),
+                        "url": org_info.get("website") or _ORG_DEFAULTS["website"],
                     },
                     {
                         "type": "button",
                         "text": {"type": "plain_text", "text": "📖 Documentation"},
-                        "url": org_info.get("docs", "https://docs.kubestellar.io"),
+                        "url": org_info.get("docs") or _ORG_DEFAULTS["docs"],
                     },
                     {
                         "type": "button",
                         "text": {"type": "plain_text", "text": "🔗 GitHub Org"},
-                        "url": org_info.get("github", "https://github.com/kubestellar"),
+                        "url": org_info.get("github") or _ORG_DEFAULTS["github"],
                     },
                     {
                         "type": "button",
                         "text": {"type": "plain_text", "text": "✨ Join Us"},
-                        "url": org_info.get("github", "http://kubestellar.io/join_us"),
+                        "url": org_info.get("github") or _ORG_DEFAULTS["join_us"],
                     },
                 ],
             },
@@ -350,8 +464,7 @@ def create_help_blocks(user_id):
 
 def create_meeting_blocks(user_id):
     """Create meeting message blocks"""
-    config = load_maintainers_config()
-    projects = config.get("projects", {})
+    config = _get_cfg()
     org_info = config.get("organization", {})
 
     blocks = [
@@ -368,13 +481,9 @@ def create_meeting_blocks(user_id):
                 "type": "mrkdwn",
                 "text": f"Hi <@{user_id}>! 🌟 *Welcome to our open source community!* We're excited you want to get involved.",
             },
-            "accessory": {
-                "type": "image",
-                "image_url": "https://avatars.githubusercontent.com/u/134407106?s=200&v=4",
-                "alt_text": "KubeStellar logo",
-            },
+            "accessory": _LOGO_ACCESSORY,
         },
-        {"type": "divider"},
+        _DIVIDER,
         {
             "type": "section",
             "text": {
@@ -399,7 +508,7 @@ def create_meeting_blocks(user_id):
                     ),
                 },
             },
-            {"type": "divider"},
+            _DIVIDER,
         ]
     )
 
@@ -414,22 +523,22 @@ def create_meeting_blocks(user_id):
                         "type": "button",
                         "text": {"type": "plain_text", "text": "🌐 Website"},
                         "style": "primary",
-                        "url": org_info.get("website", "https://kubestellar.io"),
+                        "url": org_info.get("website") or _ORG_DEFAULTS["website"],
                     },
                     {
                         "type": "button",
                         "text": {"type": "plain_text", "text": "📖 Documentation"},
-                        "url": org_info.get("docs", "https://docs.kubestellar.io"),
+                        "url": org_info.get("docs") or _ORG_DEFAULTS["docs"],
                     },
                     {
                         "type": "button",
                         "text": {"type": "plain_text", "text": "🔗 GitHub Org"},
-                        "url": org_info.get("github", "https://github.com/kubestellar"),
+                        "url": org_info.get("github") or _ORG_DEFAULTS["github"],
                     },
                     {
                         "type": "button",
                         "text": {"type": "plain_text", "text": "✨ Join Us"},
-                        "url": org_info.get("github", "http://kubestellar.io/join_us"),
+                        "url": org_info.get("github") or _ORG_DEFAULTS["join_us"],
                     },
                 ],
             },
@@ -459,8 +568,7 @@ def create_meeting_blocks(user_id):
 
 def create_internship_blocks(user_id):
     """Create internship/contribution guidance blocks"""
-    project_info = get_project_info("default")
-    config = load_maintainers_config()
+    config = _get_cfg()
     org_info = config.get("organization", {})
 
     blocks = [
@@ -477,13 +585,9 @@ def create_internship_blocks(user_id):
                 "type": "mrkdwn",
                 "text": f"Hi <@{user_id}>! 🌟 *Welcome to our open source community!* We're excited you want to get involved.",
             },
-            "accessory": {
-                "type": "image",
-                "image_url": "https://avatars.githubusercontent.com/u/134407106?s=200&v=4",
-                "alt_text": "KubeStellar logo",
-            },
+            "accessory": _LOGO_ACCESSORY,
         },
-        {"type": "divider"},
+        _DIVIDER,
         {
             "type": "section",
             "text": {
@@ -530,17 +634,17 @@ def create_internship_blocks(user_id):
                     "type": "button",
                     "text": {"type": "plain_text", "text": "📖 Documentation"},
                     "style": "primary",
-                    "url": org_info.get("docs", "https://docs.kubestellar.io"),
+                    "url": org_info.get("docs") or _ORG_DEFAULTS["docs"],
                 },
                 {
                     "type": "button",
                     "text": {"type": "plain_text", "text": "🔗 GitHub Organization"},
-                    "url": org_info.get("github", "https://github.com/kubestellar"),
+                    "url": org_info.get("github") or _ORG_DEFAULTS["github"],
                 },
                 {
                     "type": "button",
                     "text": {"type": "plain_text", "text": "🌐 Community Website"},
-                    "url": org_info.get("website", "https://kubestellar.io"),
+                    "url": org_info.get("website") or _ORG_DEFAULTS["website"],
                 },
             ],
         },
@@ -549,7 +653,7 @@ def create_internship_blocks(user_id):
             "text": {
                 "type": "mrkdwn",
                 # "text": f"🤝 *Need Help?*\n*New to open source?* Perfect! We love helping first-time contributors.\n\n*Questions or need guidance?* Tag: {format_maintainers(project_info.get('maintainers', ['Andy']))}"
-                "text": f"🤝 *Need Help?*\n*New to open source?* Perfect! We love helping first-time contributors.\n\n*Questions or need guidance?* Tag: Andy Anderson",
+                "text": "🤝 *Need Help?*\n*New to open source?* Perfect! We love helping first-time contributors.\n\n*Questions or need guidance?* Tag: Andy Anderson",
             },
         },
         {
@@ -573,82 +677,219 @@ def create_internship_blocks(user_id):
     return blocks
 
 
-@app.route("/slack/commands", methods=["POST"])
-def handle_slash_commands():
-    """Handle all slash commands"""
-    try:
-        # Verify the request is from Slack
-        if not verify_slack_request(request):
-            return jsonify({"error": "Invalid request"}), 403
+def create_welcome_blocks(user_id):
+    """Create welcome direct message blocks"""
+    config = _get_cfg()
+    org_info = config.get("organization", {})
 
-        # Parse form data
-        command = request.form.get("command", "").strip()
-        user_id = request.form.get("user_id")
-        username = request.form.get("user_name")
-        channel_id = request.form.get("channel_id")
+    blocks = [
+        {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": "🎉 Hey there, welcome to KubeStellar!",
+            },
+        },
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"Hi <@{user_id}>! 🌟 *Welcome to our open source community!* We're thrilled to have you here.",
+            },
+            "accessory": _LOGO_ACCESSORY,
+        },
+        _DIVIDER,
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": "🚀 *Getting Started Guide*\n\n📋 *Explore Our Projects*\nChoose what interests you most:",
+            },
+        },
+        {
+            "type": "section",
+            "fields": [
+                {
+                    "type": "mrkdwn",
+                    "text": "`/contribute`\nKubeStellar Core (multi-cluster management)",
+                },
+                {
+                    "type": "mrkdwn",
+                    "text": "`/kubeflex`\nKubeFlex (flexible cluster tools)",
+                },
+                {
+                    "type": "mrkdwn",
+                    "text": "`/ui`\nKubeStellar UI (web interfaces)",
+                },
+                {
+                    "type": "mrkdwn",
+                    "text": "`/a2a`\nApp-to-App communication framework",
+                },
+            ],
+        },
+        {
+            "type": "actions",
+            "elements": [
+                {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "📖 Documentation"},
+                    "style": "primary",
+                    "url": org_info.get("docs") or _ORG_DEFAULTS["docs"],
+                },
+                {
+                    "type": "button",
+                    "text": {
+                        "type": "plain_text",
+                        "text": "🔗 GitHub Organization",
+                    },
+                    "url": org_info.get("github") or _ORG_DEFAULTS["github"],
+                },
+                {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "🌐 Community Website"},
+                    "url": org_info.get("website") or _ORG_DEFAULTS["website"],
+                },
+            ],
+        },
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": "🤝 *Need Help?*\n*New to open source?* Perfect! We're here to guide you.\n\n*Have questions?* Use `/help` to see all commands and find the right maintainers to tag.",
+            },
+        },
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": "💡 *Pro Tips for New Contributors*\n1. Start with `/contribute` to understand our main project\n2. Look for \"good first issue\" labels on GitHub\n3. Join our community discussions\n4. Don't hesitate to ask questions - we're friendly! 😊",
+            },
+        },
+        {
+            "type": "context",
+            "elements": [
+                {
+                    "type": "mrkdwn",
+                    "text": "🚀✨ *Ready to make an impact?* Let's build the future of Kubernetes together!\n\n*Happy coding!* 🧰",
+                }
+            ],
+        },
+    ]
 
-        logger.info(f"Received command: {command} from user: {username}")
+    return blocks
 
-        # Handle different commands
-        if command == "/contribute":
-            project_info = {
-                "project_name": "KubeStellar",
-                "docs_url": "https://docs.kubestellar.io",
-                "github_url": "https://github.com/kubestellar/kubestellar",
-                "description": "Multi-cluster configuration management for Kubernetes",
-                "maintainers": ["Andy"],
+
+# Project card shown for /contribute
+CONTRIBUTE_PROJECT_INFO = {
+    "project_name": "KubeStellar",
+    "docs_url": "https://docs.kubestellar.io",
+    "github_url": "https://github.com/kubestellar/kubestellar",
+    "description": "Multi-cluster configuration management for Kubernetes",
+    "maintainers": ["Andy"],
+}
+
+
+def _project_handler(command_type, project_info=None):
+    """Build a command handler rendering the project card for command_type
+
+    The card only depends on the config and the user id, so it goes through
+    render_blocks() and is encoded once per config load.
+    """
+
+    def build(user_id):
+        config = _get_cfg()
+        info = project_info
+        if info is None:
+            info = get_project_info(command_type, config)
+        org_info = config.get("organization", {})
+        return create_project_blocks(user_id, info, org_info, command_type)
+
+    return partial(render_blocks, build)
+
+
+# Slash command -> handler(user_id) returning the encoded response blocks
+COMMAND_HANDLERS = {
+    "/contribute": _project_handler("contribute", CONTRIBUTE_PROJECT_INFO),
+    "/kubestellar": _project_handler("kubestellar"),
+    "/kubeflex": _project_handler("kubeflex"),
+    "/ui": _project_handler("ui"),
+    "/a2a": _project_handler("a2a"),
+    "/know-about-internship": partial(render_blocks, create_internship_blocks),
+    "/help": partial(render_blocks, create_help_blocks),
+    "/meeting": partial(render_blocks, create_meeting_blocks),
+}
+
+
+MAX_COMMAND_LENGTH = max(map(len, COMMAND_HANDLERS))
+
+# Pre-encoded reply for unrecognised commands; the command replaces {CMD}
+UNKNOWN_COMMAND_RESPONSE = orjson.dumps(
+    {
+        "response_type": "in_channel",
+        "blocks": [
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "❌ Unknown command: `{CMD}`\n\nType `/help` to see available commands.",
+                },
             }
-            blocks = create_project_blocks(user_id, project_info, "contribute")
+        ],
+    }
+)
 
-        elif command == "/kubestellar":
-            project_info = get_project_info("kubestellar")
-            blocks = create_project_blocks(user_id, project_info, "kubestellar")
 
-        elif command == "/kubeflex":
-            project_info = get_project_info("kubeflex")
-            blocks = create_project_blocks(user_id, project_info, "kubeflex")
+def unknown_command_response(command):
+    """Return the unknown command reply for command"""
+    return app.response_class(
+        UNKNOWN_COMMAND_RESPONSE.replace(b"{CMD}", orjson.dumps(command)[1:-1]),
+        mimetype="application/json",
+    )
 
-        elif command == "/ui":
-            project_info = get_project_info("ui")
-            blocks = create_project_blocks(user_id, project_info, "ui")
 
-        elif command == "/a2a":
-            project_info = get_project_info("a2a")
-            blocks = create_project_blocks(user_id, project_info, "a2a")
+# Pre-encoded replies for rejected requests and unexpected failures
+INVALID_REQUEST_RESPONSE = orjson.dumps({"error": "Invalid request"})
+ERROR_RESPONSE = orjson.dumps(
+    {
+        "response_type": "ephemeral",
+        "text": "Sorry, something went wrong. Please try again later.",
+    }
+)
 
-        elif command == "/know-about-internship":
-            blocks = create_internship_blocks(user_id)
 
-        elif command == "/help":
-            blocks = create_help_blocks(user_id)
+@app.route("/slack/commands", methods=["POST"])
+def handle_slash_commands():
+    """Handle all slash commands"""
+    try:
+        # Verify the request is from Slack
+        if not verify_slack_request(request):
+            return app.response_class(
+                INVALID_REQUEST_RESPONSE, status=403, mimetype="application/json"
+            )
 
-        elif command == "/meeting":
-            blocks = create_meeting_blocks(user_id)
+        # Parse form data
+        form = request.form
+        command = form.get("command", "").strip()
+        user_id = form.get("user_id")
+        username = form.get("user_name")
 
-        else:
-            blocks = [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"❌ Unknown command: `{command}`\n\nType `/help` to see available commands.",
-                    },
-                }
-            ]
+        logger.info(f"Received command: {command} from user: {username}")
+
+        # Dispatch to the command's handler; anything longer than the longest
+        # known command is rejected without hashing it
+        handler = None
+        if len(command) <= MAX_COMMAND_LENGTH:
+            handler = COMMAND_HANDLERS.get(command)
+        if handler is None:
+            return unknown_command_response(command)
 
         # Send response back to Slack with blocks
-        return jsonify({"response_type": "in_channel", "blocks": blocks})
+        return blocks_response(handler(user_id))
 
     except Exception as e:
         logger.error(f"Error handling slash command: {str(e)}")
-        return (
-            jsonify(
-                {
-                    "response_type": "ephemeral",
-                    "text": "Sorry, something went wrong. Please try again later.",
-                }
-            ),
-            500,
+        return app.response_class(
+            ERROR_RESPONSE, status=500, mimetype="application/json"
         )
 
 
@@ -656,7 +897,12 @@ def handle_slash_commands():
 def handle_events():
     """Handle Slack Events API callbacks"""
     try:
-        data = request.json
+        # Decode the raw body once with orjson; events are always JSON, so
+        # neither request.json nor the form parser is involved
+        try:
+            data = orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            return jsonify({"status": "error"}), 400
 
         # Handle URL verification challenge
         if data.get("type") == "url_verification":
@@ -672,7 +918,7 @@ def handle_events():
             user_id = user_info.get("id")
 
             if user_id:
-                send_welcome_dm(user_id)
+                _EXEC.submit(send_welcome_dm, user_id)
 
         elif event_type == "member_joined_channel":
             # User joined a specific channel
@@ -693,107 +939,7 @@ def handle_events():
 def send_welcome_dm(user_id):
     """Send welcome direct message to new user with blocks"""
     try:
-        config = load_maintainers_config()
-        org_info = config.get("organization", {})
-        default_project = config.get("projects", {}).get("default", {})
-
-        blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🎉 Hey there, welcome to KubeStellar!",
-                },
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"Hi <@{user_id}>! 🌟 *Welcome to our open source community!* We're thrilled to have you here.",
-                },
-                "accessory": {
-                    "type": "image",
-                    "image_url": "https://avatars.githubusercontent.com/u/134407106?s=200&v=4",
-                    "alt_text": "KubeStellar logo",
-                },
-            },
-            {"type": "divider"},
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "🚀 *Getting Started Guide*\n\n📋 *Explore Our Projects*\nChoose what interests you most:",
-                },
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "`/contribute`\nKubeStellar Core (multi-cluster management)",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": "`/kubeflex`\nKubeFlex (flexible cluster tools)",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": "`/ui`\nKubeStellar UI (web interfaces)",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": "`/a2a`\nApp-to-App communication framework",
-                    },
-                ],
-            },
-            {
-                "type": "actions",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "📖 Documentation"},
-                        "style": "primary",
-                        "url": org_info.get("docs", "https://docs.kubestellar.io"),
-                    },
-                    {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "🔗 GitHub Organization",
-                        },
-                        "url": org_info.get("github", "https://github.com/kubestellar"),
-                    },
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "🌐 Community Website"},
-                        "url": org_info.get("website", "https://kubestellar.io"),
-                    },
-                ],
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "🤝 *Need Help?*\n*New to open source?* Perfect! We're here to guide you.\n\n*Have questions?* Use `/help` to see all commands and find the right maintainers to tag.",
-                },
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "💡 *Pro Tips for New Contributors*\n1. Start with `/contribute` to understand our main project\n2. Look for \"good first issue\" labels on GitHub\n3. Join our community discussions\n4. Don't hesitate to ask questions - we're friendly! 😊",
-                },
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "🚀✨ *Ready to make an impact?* Let's build the future of Kubernetes together!\n\n*Happy coding!* 🧰",
-                    }
-                ],
-            },
-        ]
+        blocks = render_blocks(create_welcome_blocks, user_id).decode()
 
         # Send DM using chat.postMessage with blocks
         response = slack_client.chat_postMessage(
@@ -811,27 +957,61 @@ def send_welcome_dm(user_id):
         logger.error(f"Unexpected error sending welcome DM: {str(e)}")
 
 
+# Oldest request timestamp accepted, in seconds, as Slack recommends
+SLACK_REQUEST_MAX_AGE = 60 * 5
+
+
 def verify_slack_request(request):
-    """Verify that the request is from Slack (simplified version)"""
-    # In production, you should implement proper request verification
-    # using Slack's signing secret. For now, we'll do basic validation.
+    """Verify that the request is from Slack
+
+    Checks the X-Slack-Signature HMAC and request age when
+    SLACK_SIGNING_SECRET is set, otherwise only checks that the slash
+    command fields are present.
+    """
+    if SLACK_SIGNING_SECRET:
+        timestamp = request.headers.get("X-Slack-Request-Timestamp", "")
+        signature = request.headers.get("X-Slack-Signature", "")
+
+        # Reject replays of old (or malformed) requests before hashing
+        try:
+            if abs(time.time() - int(timestamp)) > SLACK_REQUEST_MAX_AGE:
+                return False
+        except ValueError:
+            return False
+
+        basestring = b"v0:" + timestamp.encode() + b":" + request.get_data(cache=True)
+        digest = hmac.new(SLACK_SIGNING_SECRET, basestring, hashlib.sha256)
+        return hmac.compare_digest(
+            b"v0=" + digest.hexdigest().encode(), signature.encode()
+        )
 
-    required_fields = ["command", "user_id", "user_name"]
-    form_data = request.form
+    form = request.form
+    return "command" in form and "user_id" in form and "user_name" in form
 
-    return all(field in form_data for field in required_fields)
+
+# Pre-encoded body for liveness/readiness probes
+HEALTH_RESPONSE = b'{"status":"healthy","version":"1.0.0"}'
+
+# Last second formatted for /health?timestamp, as [epoch second, body]
+_TS_CACHE = [0, b""]
 
 
 @app.route("/health", methods=["GET"])
 def health_check():
-    """Health check endpoint"""
-    return jsonify(
-        {
-            "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "version": "1.0.0",
-        }
-    )
+    """Health check endpoint (add ?timestamp to include the server time)"""
+    if "timestamp" not in request.args:
+        return app.response_class(HEALTH_RESPONSE, mimetype="application/json")
+
+    now = int(time.time())
+    cached = _TS_CACHE
+    if now != cached[0]:
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)).encode()
+        cached = [
+            now,
+            b'{"status":"healthy","timestamp":"' + stamp + b'","version":"1.0.0"}',
+        ]
+        _TS_CACHE[:] = cached
+    return app.response_class(cached[1], mimetype="application/json")
 
 
 @app.route("/", methods=["GET"])
@@ -849,16 +1029,23 @@ def root():
     )
 
 
+def warm_caches():
+    """Load the config and encode every message before the first request"""
+    load_maintainers_config()
+    for handler in COMMAND_HANDLERS.values():
+        handler(USER_ID_PLACEHOLDER)
+    render_blocks(create_welcome_blocks, USER_ID_PLACEHOLDER)
+
+
+# With gunicorn's preload_app this runs once in the master before forking
+warm_caches()
+
+
 if __name__ == "__main__":
-    # Check for required environment variables
-    if not os.environ.get("SLACK_BOT_TOKEN"):
-        logger.error("SLACK_BOT_TOKEN environment variable is required")
-        exit(1)
-
-    # Run the Flask app
-    port = int(os.environ.get("PORT", 3000))
-    app.run(
-        host="0.0.0.0",
-        port=port,
-        debug=os.environ.get("DEBUG", "False").lower() == "true",
+    # Run the Flask development server; production should use gunicorn
+    logger.warning(
+        "Using the Flask development server; run 'gunicorn -c gunicorn_conf.py "
+        "app:app' in production"
     )
+    # The reloader would import and load everything a second time
+    app.run(host="0.0.0.0", port=PORT, debug=DEBUG, use_reloader=False)
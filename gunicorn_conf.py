@@ -0,0 +1,17 @@
+"""gunicorn settings for the RepoRover Slack bot
+
+Run with: gunicorn -c gunicorn_conf.py app:app
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '3000')}"
+
+# Threaded workers so slow Slack API calls don't hold up other requests
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = 8
+
+# Import app.py once in the master; workers inherit it on fork
+preload_app = True